@@ -6,7 +6,7 @@ Run this script from your ytmusicapi repo root:
 It will automatically patch the get_lyrics method in ytmusicapi/mixins/browsing.py
 """
 
-import re
+import ast
 
 NEW_GET_LYRICS = '''    def get_lyrics(self, browseId: str) -> dict:
         """
@@ -71,6 +71,26 @@ NEW_GET_LYRICS = '''    def get_lyrics(self, browseId: str) -> dict:
 
 '''
 
+def find_method(source, name):
+    """
+    Return the first and last line (1-based) of method `name`, including decorators.
+
+    If the method has @overload stubs, the span covers all of its definitions.
+    """
+    tree = ast.parse(source)
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        defs = [
+            item for item in node.body
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) and item.name == name
+        ]
+        if defs:
+            start = min(d.lineno for item in defs for d in [item, *item.decorator_list])
+            return start, max(item.end_lineno for item in defs)
+    return None
+
+
 def patch_file():
     filepath = "ytmusicapi/mixins/browsing.py"
 
@@ -81,16 +101,31 @@ def patch_file():
         print(f"Error: {filepath} not found. Run this from the ytmusicapi repo root.")
         return False
 
-    # Pattern to match the entire get_lyrics method
-    pattern = r'(    def get_lyrics\(self.*?)(?=\n    def |\nclass |\Z)'
-
-    match = re.search(pattern, content, re.DOTALL)
-    if not match:
+    # Locate the get_lyrics method from the syntax tree, independent of formatting
+    try:
+        span = find_method(content, "get_lyrics")
+    except SyntaxError as e:
+        print(f"Error: Could not parse {filepath}: {e}")
+        return False
+    if span is None:
         print("Error: Could not find get_lyrics method in file.")
         return False
 
     # Replace the old method with the new one
-    new_content = content[:match.start()] + NEW_GET_LYRICS + content[match.end():]
+    start, end = span
+    lines = content.splitlines(keepends=True)
+    new_method = NEW_GET_LYRICS.rstrip("\n") + "\n"
+    new_content = "".join(lines[:start - 1]) + new_method + "".join(lines[end:])
+    # Never write out a file that no longer parses
+    try:
+        ast.parse(new_content)
+    except SyntaxError as e:
+        print(f"Error: Patching {filepath} would produce invalid Python: {e}")
+        return False
+
+    if new_content == content:
+        print(f"{filepath} is already patched.")
+        return True
 
     # Backup original
     with open(filepath + ".bak", "w") as f:
@@ -1,14 +1,27 @@
 """Tests for synced lyrics functionality."""
 
+import json
+import threading
+import time
+
 import pytest
+import requests
 from unittest.mock import Mock, patch
 
+from ytmusicapi.exceptions import LyricsProviderError
 from ytmusicapi.providers import (
     SyncedLyricsSearcher,
     LrcLibProvider,
+    NetEaseProvider,
+    MegalobizProvider,
     SyncedLyrics,
     LyricLine,
+    Query,
+    iter_lrc,
 )
+from ytmusicapi.providers import megalobiz
+from ytmusicapi.providers.base import normalize
+from ytmusicapi.providers.cache import MISSING, DiskCache
 from ytmusicapi.mixins.lyrics import LyricsMixin
 
 
@@ -49,6 +62,53 @@ class TestSyncedLyrics:
         )
         assert lyrics.get_line_at(5000).text == "Line 2"
         assert lyrics.get_line_at(7000).text == "Line 2"
+        assert lyrics.get_line_at(4999).text == "Line 1"
+        assert lyrics.get_line_at(999) is None
+
+    def test_get_line_at_after_append(self):
+        lyrics = SyncedLyrics(track="Test", artist="Artist", lrc="")
+        assert lyrics.get_line_at(1000) is None
+        lyrics.lines.append(LyricLine("[00:01.00]", "Line 1", 1000))
+        assert lyrics.get_line_at(1000).text == "Line 1"
+
+    def test_from_lrc(self):
+        lrc = "[ti:Test]\n[00:01.00]Line 1\n[00:02.5]Line 2\n\n[01:03.456] Line 3 \nNo timestamp"
+        lyrics = SyncedLyrics.from_lrc(lrc, "Test", "Artist", "lrclib")
+        assert lyrics.lrc == lrc
+        assert lyrics.source == "lrclib"
+        assert [line.milliseconds for line in lyrics.lines] == [1000, 2500, 63456]
+        assert [line.timestamp for line in lyrics.lines] == ["[00:01.00]", "[00:02.50]", "[01:03.45]"]
+        assert lyrics.lines[2].text == "Line 3"
+
+    def test_from_lrc_multiple_timestamps(self):
+        lyrics = SyncedLyrics.from_lrc("[00:10.00][00:01.00]Chorus\n[00:05.00]Verse", "Test", "Artist")
+        assert [(line.milliseconds, line.text) for line in lyrics.lines] == [
+            (1000, "Chorus"),
+            (5000, "Verse"),
+            (10000, "Chorus"),
+        ]
+
+    def test_from_lrc_plain_text(self):
+        assert SyncedLyrics.from_lrc("Just plain text", "Test", "Artist").lines == []
+
+
+def test_normalize():
+    assert normalize("  Ed   Sheeran ") == "ed sheeran"
+    assert normalize("ＡＢＣ") == "abc"
+    assert normalize("Straße") == normalize("STRASSE")
+
+
+def test_iter_lrc():
+    lines = iter_lrc("[ti:Title]\n[00:02.00]Second\n[00:01.00][00:03.5]Chorus")
+    assert next(lines) == LyricLine("[00:02.00]", "Second", 2000)
+    assert [(line.milliseconds, line.text) for line in lines] == [(1000, "Chorus"), (3500, "Chorus")]
+
+
+def test_query():
+    query = Query.of("Ｓｏｎｇ  Title", "ARTIST")
+    assert query.key == ("song title", "artist")
+    assert query.track == "Ｓｏｎｇ  Title"
+    assert Query.of("Ｓｏｎｇ  Title", "ARTIST") is query
 
 
 class TestSyncedLyricsSearcher:
@@ -61,6 +121,157 @@ class TestSyncedLyricsSearcher:
         searcher = SyncedLyricsSearcher()
         assert searcher._is_synced("[00:01.00]Hello") is True
         assert searcher._is_synced("Just plain text") is False
+        assert searcher._is_synced("[ti:Title]\n[ar:Artist]\n[00:01.00]Hello") is True
+        assert searcher._is_synced("Hello [00:01.00]") is False
+
+    def test_search_many_preserves_order(self):
+        searcher = SyncedLyricsSearcher(["lrclib"])
+        provider = searcher._providers[0][1]
+        with (
+            patch.object(provider, "bulk_probe", return_value={}),
+            patch.object(provider, "get_lyrics", side_effect=lambda track, artist: f"[00:01.00]{track}"),
+        ):
+            results = searcher.search_many([(f"Song {i}", "Artist") for i in range(20)])
+        assert [r.lines[0].text for r in results] == [f"Song {i}" for i in range(20)]
+
+    def test_search_many_bulk_probe(self):
+        searcher = SyncedLyricsSearcher(["lrclib"])
+        provider = searcher._providers[0][1]
+        items = [("Song 1", "Artist"), ("Song 2", "Artist"), ("Song 3", "Other")]
+        probed = {("Song 1", "Artist"): "[00:01.00]Probed", ("Song 2", "Artist"): "Plain"}
+        with (
+            patch.object(provider, "bulk_probe", return_value=probed) as bulk_probe,
+            patch.object(provider, "get_lyrics", return_value="[00:01.00]Single") as get_lyrics,
+        ):
+            results = searcher.search_many(items)
+        assert [r.lines[0].text for r in results] == ["Probed", "Single", "Single"]
+        assert bulk_probe.call_count == 2
+        assert get_lyrics.call_count == 2
+
+    def test_search_race(self):
+        searcher = SyncedLyricsSearcher(["lrclib", "netease"])
+        lrclib, netease = (provider for _, provider in searcher._providers)
+        release = threading.Event()
+
+        def slow_lyrics(track, artist):
+            release.wait(5)
+            return "[00:01.00]Slow"
+
+        with (
+            patch.object(lrclib, "get_lyrics", side_effect=slow_lyrics),
+            patch.object(netease, "get_lyrics", return_value="[00:01.00]Fast"),
+        ):
+            assert searcher.search("Song", "Artist", race=True).source == "netease"
+            release.set()
+            # The race result came from a fallback provider, so it must not be served from the cache
+            assert searcher.search("Song", "Artist").source == "lrclib"
+            assert searcher.search("Song", "Artist", race=True).source == "lrclib"
+
+    def test_search_race_prefers_order_on_ties(self):
+        searcher = SyncedLyricsSearcher(["lrclib", "netease", "megalobiz"])
+        lrclib, netease, megalobiz = (provider for _, provider in searcher._providers)
+        # Generous grace period, the search returns as soon as lrclib answers anyway
+        searcher.RACE_GRACE_PERIOD = 5
+        netease_done = threading.Event()
+        release = threading.Event()
+        megalobiz_done = threading.Event()
+
+        def netease_lyrics(track, artist):
+            netease_done.set()
+            return "[00:01.00]Fast"
+
+        def lrclib_lyrics(track, artist):
+            # Answer right after the fallback provider, within the grace period
+            netease_done.wait(5)
+            return "[00:01.00]Preferred"
+
+        def megalobiz_lyrics(track, artist):
+            release.wait(5)
+            megalobiz_done.set()
+            return "[00:01.00]Slow"
+
+        with (
+            patch.object(lrclib, "get_lyrics", side_effect=lrclib_lyrics),
+            patch.object(netease, "get_lyrics", side_effect=netease_lyrics),
+            patch.object(megalobiz, "get_lyrics", side_effect=megalobiz_lyrics),
+        ):
+            try:
+                assert searcher.search("Song", "Artist", race=True).source == "lrclib"
+                # Lower priority providers still running are not waited for
+                assert not megalobiz_done.is_set()
+            finally:
+                release.set()
+
+    def test_search_race_skips_unsynced(self):
+        searcher = SyncedLyricsSearcher(["lrclib", "netease"])
+        lrclib, netease = (provider for _, provider in searcher._providers)
+        with (
+            patch.object(lrclib, "get_lyrics", side_effect=requests.ConnectionError),
+            patch.object(netease, "get_lyrics", return_value="Plain text"),
+        ):
+            assert searcher.search("Song", "Artist", race=True) is None
+            # lrclib failed rather than missed, so the result isn't cached
+            assert searcher._cache_get(searcher._cache_key("Song", "Artist", True)) is MISSING
+            assert searcher.search("Song", "Artist", synced_only=False, race=True).source == "netease"
+
+    def test_search_all_concurrent(self):
+        searcher = SyncedLyricsSearcher(["lrclib", "netease", "megalobiz"])
+        lrclib, netease, megalobiz = (provider for _, provider in searcher._providers)
+
+        # Both lookups only finish once the other one has started, so they must run concurrently
+        barrier = threading.Barrier(2, timeout=5)
+
+        def concurrent_lyrics(track, artist):
+            barrier.wait()
+            return "[00:01.00]Concurrent"
+
+        with (
+            patch.object(lrclib, "get_lyrics", side_effect=concurrent_lyrics),
+            patch.object(netease, "get_lyrics", side_effect=concurrent_lyrics),
+            patch.object(megalobiz, "get_lyrics", side_effect=requests.ConnectionError),
+        ):
+            results = searcher.search_all("Song", "Artist")
+        assert [r.source for r in results] == ["lrclib", "netease"]
+
+    def test_search_iter(self):
+        searcher = SyncedLyricsSearcher(["lrclib"])
+        provider = searcher._providers[0][1]
+        with patch.object(provider, "get_lyrics", return_value="[00:01.00]Hello\n[00:02.00]World") as get_lyrics:
+            assert [line.text for line in searcher.search_iter("Song", "Artist")] == ["Hello", "World"]
+            searcher.search("Song", "Artist")
+            assert [line.text for line in searcher.search_iter("Song", "Artist")] == ["Hello", "World"]
+            assert get_lyrics.call_count == 2
+        with patch.object(provider, "get_lyrics", return_value=None):
+            assert list(searcher.search_iter("Other", "Artist")) == []
+
+    def test_search_iter_document_order_when_cached(self):
+        searcher = SyncedLyricsSearcher(["lrclib"])
+        provider = searcher._providers[0][1]
+        lrc = "[00:05.00]Verse\n[00:01.00][00:10.00]Chorus"
+        with patch.object(provider, "get_lyrics", return_value=lrc):
+            fresh = [line.milliseconds for line in searcher.search_iter("Song", "Artist")]
+            searcher.search("Song", "Artist")
+            cached = [line.milliseconds for line in searcher.search_iter("Song", "Artist")]
+        assert fresh == cached == [5000, 1000, 10000]
+
+    def test_providers_share_session(self):
+        searcher = SyncedLyricsSearcher()
+        sessions = {id(provider.session) for _, provider in searcher._providers}
+        assert len(sessions) == 1
+
+    def test_close(self, tmp_path):
+        searcher = SyncedLyricsSearcher(["lrclib", "netease"], cache_dir=str(tmp_path))
+        netease = searcher._providers[1][1]
+        with patch.object(searcher._disk_cache, "close") as disk_close, \
+                patch.object(netease._disk_cache, "close") as netease_close:
+            searcher.close()
+        disk_close.assert_called_once()
+        netease_close.assert_called_once()
+        with pytest.raises(RuntimeError):
+            searcher._executor.submit(time.sleep, 0)
+
+    def test_search_many_empty(self):
+        assert SyncedLyricsSearcher().search_many([]) == []
 
 
 class TestLyricsMixin:
@@ -69,7 +280,300 @@ class TestLyricsMixin:
         assert mixin._clean_song_title("Song (Official Video)") == "Song"
         assert mixin._clean_song_title("Song [Official Audio]") == "Song"
 
+    @pytest.mark.parametrize(
+        ("title", "expected"),
+        [
+            ("Song (Official Music Video)", "Song"),
+            ("Song (Lyric Video)", "Song"),
+            ("Song [Visualizer]", "Song"),
+            ("Song (feat. Someone) [Official Video]", "Song"),
+            ("Song (ft. Someone)", "Song"),
+            ("Song (with Someone)", "Song"),
+            ("Song (Remastered 2011)", "Song"),
+            ("Song (1999 Version)", "Song"),
+            ("Song - Official Video", "Song"),
+            ("Song | Some Channel", "Song"),
+            ("Song (Live) -", "Song (Live)"),
+            ("Song   Title [HD]", "Song Title"),
+            ("Video Games", "Video Games"),
+        ],
+    )
+    def test_clean_song_title_patterns(self, title, expected):
+        assert LyricsMixin()._clean_song_title(title) == expected
+
     def test_clean_artist_name(self):
         mixin = LyricsMixin()
         assert mixin._clean_artist_name("Artist - Topic") == "Artist"
         assert mixin._clean_artist_name("ArtistVEVO") == "Artist"
+
+
+    def test_configure_closes_previous_searcher(self):
+        mixin = LyricsMixin()
+        mixin.configure_lyrics_providers(["lrclib"])
+        previous = mixin.lyrics_searcher
+        with patch.object(previous, "close") as close:
+            mixin.configure_lyrics_providers(["netease"])
+        close.assert_called_once()
+        assert [name for name, _ in mixin.lyrics_searcher._providers] == ["netease"]
+
+
+class TestSearcherCache:
+    def test_disk_hit_keeps_expiry(self, tmp_path):
+        searcher = SyncedLyricsSearcher(["lrclib"], cache_dir=str(tmp_path))
+        provider = searcher._providers[0][1]
+        with patch.object(provider, "get_lyrics", return_value=None):
+            searcher.search("Song", "Artist")
+
+        searcher = SyncedLyricsSearcher(["lrclib"], cache_dir=str(tmp_path))
+        key = searcher._cache_key("Song", "Artist", True)
+        assert searcher.search("Song", "Artist") is None
+        expires, _ = searcher._memory_cache._data[key]
+        assert expires is not None
+        assert expires - time.monotonic() <= SyncedLyricsSearcher.CACHE_MISS_TTL
+
+    def test_disk_cache_purges_expired(self, tmp_path):
+        cache = DiskCache(str(tmp_path))
+        cache.set("old", "value", ttl=-1)
+        cache.set("new", "value", ttl=60)
+        assert cache.get_with_ttl("old", MISSING) == (MISSING, None)
+        cache.set("stale", "value", ttl=-1)
+        cache.close()
+
+        cache = DiskCache(str(tmp_path))
+        assert cache._conn.execute("SELECT key FROM cache").fetchall() == [("new",)]
+        value, ttl = cache.get_with_ttl("new")
+        assert value == "value" and 0 < ttl <= 60
+        cache.close()
+
+    def test_disk_cache_persists(self, tmp_path):
+        searcher = SyncedLyricsSearcher(["lrclib"], cache_dir=str(tmp_path))
+        provider = searcher._providers[0][1]
+        with patch.object(provider, "get_lyrics", return_value="[00:01.00]Hello") as get_lyrics:
+            assert searcher.search("Song", "Artist").lines[0].text == "Hello"
+            assert searcher.search("song ", "ARTIST").lines[0].text == "Hello"
+            assert searcher.search("Ｓｏｎｇ", "Artist").lines[0].text == "Hello"
+            assert get_lyrics.call_count == 1
+
+        searcher = SyncedLyricsSearcher(["lrclib"], cache_dir=str(tmp_path))
+        provider = searcher._providers[0][1]
+        with patch.object(provider, "get_lyrics") as get_lyrics:
+            lyrics = searcher.search("Song", "Artist")
+            assert lyrics.source == "lrclib"
+            assert lyrics.lines[0].milliseconds == 1000
+            get_lyrics.assert_not_called()
+
+    def test_misses_cached_and_no_cache(self, tmp_path):
+        searcher = SyncedLyricsSearcher(["lrclib"], cache_dir=str(tmp_path))
+        provider = searcher._providers[0][1]
+        with patch.object(provider, "get_lyrics", return_value=None) as get_lyrics:
+            assert searcher.search("Song", "Artist") is None
+            assert searcher.search("Song", "Artist") is None
+            assert get_lyrics.call_count == 1
+            assert searcher.search("Song", "Artist", no_cache=True) is None
+            assert get_lyrics.call_count == 2
+
+    def test_cache_hits_are_independent(self):
+        searcher = SyncedLyricsSearcher(["lrclib"])
+        provider = searcher._providers[0][1]
+        with patch.object(provider, "get_lyrics", return_value="[00:01.00]Hello") as get_lyrics:
+            first = searcher.search("Song", "Artist")
+            first.lines[0].text = "Edited"
+            second = searcher.search("song", "ARTIST")
+            assert get_lyrics.call_count == 1
+        assert second.lines[0].text == "Hello"
+        assert (second.track, second.artist, second.source) == ("song", "ARTIST", "lrclib")
+
+    def test_failures_not_cached(self):
+        searcher = SyncedLyricsSearcher(["lrclib"])
+        response = Mock(status_code=200)
+        response.content = json.dumps({"syncedLyrics": "[00:01.00]Hello"})
+        with patch.object(searcher._session, "get", side_effect=[requests.ConnectionError(), response]):
+            assert searcher.search("Song", "Artist") is None
+            assert searcher.search("Song", "Artist").lines[0].text == "Hello"
+        with patch.object(searcher._session, "get", side_effect=[requests.ConnectionError(), response]):
+            assert searcher.search_many([("Other", "Artist")]) == [None]
+            assert searcher.search_many([("Other", "Artist")])[0].lines[0].text == "Hello"
+
+    def test_memory_cache_by_default(self):
+        searcher = SyncedLyricsSearcher(["lrclib"])
+        provider = searcher._providers[0][1]
+        with patch.object(provider, "get_lyrics", return_value="[00:01.00]Hello") as get_lyrics:
+            assert searcher.search("Song", "Artist").lines[0].text == "Hello"
+            assert searcher.search("song", "artist").lines[0].text == "Hello"
+            assert get_lyrics.call_count == 1
+
+        searcher = SyncedLyricsSearcher(["lrclib"], cache_size=0)
+        provider = searcher._providers[0][1]
+        with patch.object(provider, "get_lyrics", return_value="[00:01.00]Hello") as get_lyrics:
+            searcher.search("Song", "Artist")
+            searcher.search("Song", "Artist")
+            assert get_lyrics.call_count == 2
+
+
+class TestLrcLibProvider:
+    def test_exact_match_cached(self):
+        provider = LrcLibProvider()
+        response = Mock(status_code=200)
+        response.content = json.dumps({"syncedLyrics": "[00:01.00]Hello"})
+        with patch.object(provider.session, "get", return_value=response) as get:
+            assert provider.get_lyrics("Song", "Artist") == "[00:01.00]Hello"
+            assert provider.get_lyrics("song", " artist") == "[00:01.00]Hello"
+            assert get.call_count == 1
+
+    def test_bulk_probe(self):
+        provider = LrcLibProvider()
+        response = Mock(status_code=200)
+        response.content = json.dumps([
+            {"trackName": "Song One", "artistName": "Artist", "plainLyrics": "Plain"},
+            {"trackName": "Song One", "artistName": "Artist", "syncedLyrics": "[00:01.00]One"},
+            {"trackName": "Song Two (Live)", "artistName": "Artist", "syncedLyrics": "[00:01.00]Live"},
+            {"trackName": "Song Three", "artistName": "Someone Else", "syncedLyrics": "[00:01.00]Other"},
+        ])
+        queries = [("Song one", "Artist"), ("Song Two", "Artist"), ("Song Three", "Artist"), ("Solo", "Single")]
+        with patch.object(provider.session, "get", return_value=response) as get:
+            found = provider.bulk_probe(queries)
+        assert found == {("Song one", "Artist"): "[00:01.00]One"}
+        get.assert_called_once()
+
+    def test_bulk_probe_numbered_titles(self):
+        provider = LrcLibProvider()
+        response = Mock(status_code=200)
+        response.content = json.dumps([
+            {"trackName": "Interlude 2", "artistName": "Artist", "syncedLyrics": "[00:01.00]Two"},
+            {"trackName": "Part 1", "artistName": "Artist", "syncedLyrics": "[00:01.00]Part One"},
+        ])
+        queries = [("Interlude 1", "Artist"), ("Part 2", "Artist"), ("part  1", "Artist")]
+        with patch.object(provider.session, "get", return_value=response):
+            found = provider.bulk_probe(queries)
+        assert found == {("part  1", "Artist"): "[00:01.00]Part One"}
+
+    def test_errors_not_cached(self):
+        provider = LrcLibProvider()
+        response = Mock(status_code=200)
+        response.content = json.dumps({"syncedLyrics": "[00:01.00]Hello"})
+        with patch.object(provider.session, "get", side_effect=requests.ConnectionError):
+            with pytest.raises(LyricsProviderError):
+                provider._get_exact_match("Song", "Artist")
+        with patch.object(provider.session, "get", return_value=response):
+            assert provider._get_exact_match("Song", "Artist") == "[00:01.00]Hello"
+
+
+class TestNetEaseProvider:
+    def test_search_song_cached(self):
+        provider = NetEaseProvider()
+        response = Mock(status_code=200)
+        response.content = json.dumps({
+            "result": {"songs": [{"id": 42, "name": "Song", "artists": [{"name": "Artist"}]}]}
+        })
+        lyrics = Mock(status_code=200)
+        lyrics.content = json.dumps({
+            "lrc": {"lyric": "[00:01.00]Original"},
+            "tlyric": {"lyric": "[00:01.00]Translated"},
+        })
+        with patch.object(provider.session, "post", return_value=response) as post, \
+                patch.object(provider.session, "get", return_value=lyrics) as get:
+            assert provider.get_lyrics("Song", "Artist") == "[00:01.00]Original"
+            assert provider.get_translation("song ", "ARTIST") == "[00:01.00]Translated"
+        assert post.call_count == 1
+        assert get.call_count == 1
+
+    def test_disk_cache(self, tmp_path):
+        search = Mock(status_code=200)
+        search.content = json.dumps({"result": {"songs": [{"id": 42, "name": "Song", "artists": []}]}})
+        lyrics = Mock(status_code=200)
+        lyrics.content = json.dumps({"lrc": {"lyric": "[00:01.00]Hello"}})
+
+        provider = NetEaseProvider(cache_dir=str(tmp_path))
+        with patch.object(provider.session, "post", return_value=search), \
+                patch.object(provider.session, "get", return_value=lyrics):
+            assert provider.get_lyrics("Song", "Artist") == "[00:01.00]Hello"
+
+        provider = NetEaseProvider(cache_dir=str(tmp_path))
+        with patch.object(provider.session, "post") as post, patch.object(provider.session, "get") as get:
+            assert provider.get_lyrics("Song", "Artist") == "[00:01.00]Hello"
+            post.assert_not_called()
+            get.assert_not_called()
+
+    def test_lyrics_payload_missing_versions(self):
+        provider = NetEaseProvider()
+        response = Mock(status_code=200)
+        response.content = json.dumps({"lrc": {"lyric": ""}, "klyric": {"lyric": "[00:01.00]Karaoke"}, "tlyric": None})
+        with patch.object(provider.session, "get", return_value=response):
+            assert provider._get_lyrics_payload(42) == {"lrc": "", "klyric": "[00:01.00]Karaoke", "tlyric": None}
+            assert provider._get_lyrics_by_id(42) == "[00:01.00]Karaoke"
+
+    def test_search_song_matches_normalized_names(self):
+        provider = NetEaseProvider()
+        response = Mock(status_code=200)
+        response.content = json.dumps({"result": {"songs": [
+            {"id": 1, "name": "Other", "artists": [{"name": "Artist"}]},
+            {"id": 2, "name": "ＳＯＮＧ Title", "artists": [{"name": "The  Artist"}]},
+        ]}})
+        with patch.object(provider.session, "post", return_value=response):
+            assert provider._search_song("Song  Title", "the artist") == 2
+
+    def test_searcher_cache_dir(self, tmp_path):
+        searcher = SyncedLyricsSearcher(["netease"], cache_dir=str(tmp_path))
+        assert searcher._providers[0][1]._disk_cache is not None
+        assert SyncedLyricsSearcher(["netease"])._providers[0][1]._disk_cache is None
+
+    def test_search_song_errors_not_cached(self):
+        provider = NetEaseProvider()
+        with patch.object(provider.session, "post", side_effect=requests.ConnectionError) as post:
+            for _ in range(2):
+                with pytest.raises(LyricsProviderError):
+                    provider._search_song("Song", "Artist")
+        assert post.call_count == 2
+
+
+class TestMegalobizProvider:
+    def test_find_lrc_link_prefers_maker(self):
+        provider = MegalobizProvider()
+        page = b'<a href="/lrc/other">x</a><a href="/lrc/maker/song.123.megalobiz">y</a>'
+        assert provider._find_lrc_link([page]) == "/lrc/maker/song.123.megalobiz"
+        assert provider._find_lrc_link([b'<a href="/lrc/other">x</a>']) == "/lrc/other"
+        assert provider._find_lrc_link([b"<html></html>"]) is None
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 16])
+    def test_find_lrc_link_chunked(self, chunk_size):
+        provider = MegalobizProvider()
+        page = b'<a href="/about">a</a><a href="/lrc/other">x</a><a href="/lrc/maker/song.123.megalobiz">y</a>'
+        chunks = [page[i:i + chunk_size] for i in range(0, len(page), chunk_size)]
+        assert provider._find_lrc_link(chunks) == "/lrc/maker/song.123.megalobiz"
+        assert provider._find_lrc_link(chunks[:len(chunks) // 2]) == "/lrc/other"
+
+    def test_find_lrc_link_scans_linearly(self):
+        provider = MegalobizProvider()
+        page = b'<a href="/about">a</a>' + b"x" * 500_000 + b'<a href="/lrc/other">x</a>'
+        chunks = [page[i:i + 8192] for i in range(0, len(page), 8192)]
+        scanned = []
+        real_re = megalobiz._LRC_HREF_RE
+
+        def finditer(buffer):
+            scanned.append(len(buffer))
+            return real_re.finditer(buffer)
+
+        with patch.object(megalobiz, "_LRC_HREF_RE", Mock(finditer=finditer)):
+            assert provider._find_lrc_link(chunks) == "/lrc/other"
+        assert sum(scanned) < len(page) + 16 * len(chunks)
+
+    def test_find_lrc_link_stops_early(self):
+        provider = MegalobizProvider()
+        chunks = iter([b'<a href="/lrc/maker/song.megalobiz">', b"rest"])
+        assert provider._find_lrc_link(chunks) == "/lrc/maker/song.megalobiz"
+        assert next(chunks) == b"rest"
+
+    def test_extract_lrc(self):
+        provider = MegalobizProvider()
+        page = (
+            '<pre class="lyrics">[00:09.00]Other</pre>'
+            '<div id="lrc_123_lyrics">[00:01.00]Hello<br/>[00:02.00]World</div>'
+        )
+        assert provider._extract_lrc(page) == "[00:01.00]Hello\n[00:02.00]World"
+        assert provider._extract_lrc('<pre class="lyrics">[00:09.00]Other</pre>') == "[00:09.00]Other"
+        assert provider._extract_lrc("<p>no lyrics</p>") is None
+
+    def test_clean_lrc(self):
+        provider = MegalobizProvider()
+        lrc = "<span>[00:01.00]Rock&nbsp;&amp;&nbsp;Roll</span><br>\n  <br />[00:02.00]It&#39;s &quot;ok&quot; &#x27;too&#x27;  "
+        assert provider._clean_lrc(lrc) == "[00:01.00]Rock & Roll\n[00:02.00]It's \"ok\" 'too'"
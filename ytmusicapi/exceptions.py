@@ -14,3 +14,7 @@ class YTMusicUserError(YTMusicError):
 
 class YTMusicServerError(YTMusicError):
     """error caused by the YouTube Music backend"""
+
+
+class LyricsProviderError(YTMusicError):
+    """error caused by a lyrics provider that could not be reached or answered with an error"""
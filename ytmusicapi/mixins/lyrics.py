@@ -4,6 +4,26 @@ import re
 from typing import Optional, List, Dict, Any
 from ytmusicapi.providers import SyncedLyricsSearcher, SyncedLyrics
 
+# Common video suffixes removed from song titles, merged into a single
+# alternation so the title is scanned once instead of once per pattern
+_TITLE_SUFFIX_RE = re.compile(
+    r'\s*(?:'
+    r'[\(\[](?:'
+    r'(?:Official\s*)?(?:Music\s*)?(?:Video|Audio|Lyrics?|MV|M/V|HD|HQ|4K)'
+    r'|Visualizer|Lyric Video|Audio Only'
+    r'|feat\.?[^\)\]]+|ft\.?[^\)\]]+|with\s+[^\)\]]+'
+    r'|Remaster(?:ed)?[^\)\]]*|\d{4}[^\)\]]*'
+    r')[\)\]]'
+    r'|-\s*(?:Official\s*)?(?:Music\s*)?(?:Video|Audio)'
+    r'|\|\s*.*$'
+    r')',
+    re.IGNORECASE,
+)
+_WS_RE = re.compile(r'\s+')
+_TRAIL_DASH_RE = re.compile(r'\s*[-–—]\s*$')
+_TOPIC_RE = re.compile(r'\s*-\s*Topic$', re.IGNORECASE)
+_VEVO_RE = re.compile(r'VEVO$', re.IGNORECASE)
+
 
 class LyricsMixin:
     """
@@ -22,18 +42,26 @@ class LyricsMixin:
             self._lyrics_searcher = SyncedLyricsSearcher()
         return self._lyrics_searcher
 
-    def configure_lyrics_providers(self, providers: List[str]) -> None:
+    def configure_lyrics_providers(
+        self,
+        providers: List[str],
+        cache_dir: Optional[str] = None
+    ) -> None:
         """
         Configure which lyrics providers to use and their order.
 
         Args:
             providers: List of provider names.
                       Available: "lrclib", "netease", "megalobiz"
+            cache_dir: Directory for a persistent lyrics cache.
+                      If None, results are only cached in memory.
 
         Example:
-            ytmusic.configure_lyrics_providers(["lrclib", "netease"])
+            ytmusic.configure_lyrics_providers(["lrclib", "netease"], cache_dir="~/.cache/ytmusicapi")
         """
-        self._lyrics_searcher = SyncedLyricsSearcher(providers)
+        if self._lyrics_searcher is not None:
+            self._lyrics_searcher.close()
+        self._lyrics_searcher = SyncedLyricsSearcher(providers, cache_dir)
 
     def get_synced_lyrics(
         self,
@@ -123,6 +151,8 @@ class LyricsMixin:
         """
         Get synced lyrics for all tracks in a playlist.
 
+        Tracks are looked up concurrently, see :meth:`SyncedLyricsSearcher.search_many`.
+
         Args:
             playlist_id: YouTube Music playlist ID
             synced_only: If True, only return timestamped lyrics
@@ -139,12 +169,16 @@ class LyricsMixin:
         results = []
         try:
             playlist = self.get_playlist(playlist_id)
+            tracks = playlist.get("tracks", [])
 
-            for track in playlist.get("tracks", []):
+            queries = []
+            for track in tracks:
                 title = track.get("title", "")
                 artists = ", ".join([a.get("name", "") for a in track.get("artists", [])])
+                queries.append((title, artists))
 
-                lyrics = self.lyrics_searcher.search(title, artists, synced_only)
+            all_lyrics = self.lyrics_searcher.search_many(queries, synced_only)
+            for track, lyrics in zip(tracks, all_lyrics):
                 results.append({
                     "track": track,
                     "lyrics": lyrics
@@ -162,6 +196,8 @@ class LyricsMixin:
         """
         Get synced lyrics for all tracks in an album.
 
+        Tracks are looked up concurrently, see :meth:`SyncedLyricsSearcher.search_many`.
+
         Args:
             browse_id: YouTube Music album browse ID
             synced_only: If True, only return timestamped lyrics
@@ -173,8 +209,10 @@ class LyricsMixin:
         try:
             album = self.get_album(browse_id)
             album_artist = ", ".join([a.get("name", "") for a in album.get("artists", [])])
+            tracks = album.get("tracks", [])
 
-            for track in album.get("tracks", []):
+            queries = []
+            for track in tracks:
                 title = track.get("title", "")
                 # Use track artists if available, otherwise album artist
                 artists = track.get("artists")
@@ -182,8 +220,10 @@ class LyricsMixin:
                     artist = ", ".join([a.get("name", "") for a in artists])
                 else:
                     artist = album_artist
+                queries.append((title, artist))
 
-                lyrics = self.lyrics_searcher.search(title, artist, synced_only)
+            all_lyrics = self.lyrics_searcher.search_many(queries, synced_only)
+            for track, lyrics in zip(tracks, all_lyrics):
                 results.append({
                     "track": track,
                     "lyrics": lyrics
@@ -217,33 +257,18 @@ class LyricsMixin:
 
     def _clean_song_title(self, title: str) -> str:
         """Clean up song title for better lyrics matching."""
-        # Remove common video suffixes
-        patterns = [
-            r'\s*[\(\[](Official\s*)?(Music\s*)?(Video|Audio|Lyrics?|MV|M/V|HD|HQ|4K)[\)\]]',
-            r'\s*[\(\[](Visualizer|Lyric Video|Audio Only)[\)\]]',
-            r'\s*[\(\[]feat\.?[^\)\]]+[\)\]]',
-            r'\s*[\(\[]ft\.?[^\)\]]+[\)\]]',
-            r'\s*[\(\[]with\s+[^\)\]]+[\)\]]',
-            r'\s*[\(\[]Remaster(ed)?[^\)\]]*[\)\]]',
-            r'\s*[\(\[]\d{4}[^\)\]]*[\)\]]',
-            r'\s*-\s*(Official\s*)?(Music\s*)?(Video|Audio)',
-            r'\s*\|\s*.*$',
-        ]
-
-        result = title
-        for pattern in patterns:
-            result = re.sub(pattern, '', result, flags=re.IGNORECASE)
+        result = _TITLE_SUFFIX_RE.sub('', title)
 
         # Clean up extra whitespace and trailing dashes
-        result = re.sub(r'\s+', ' ', result)
-        result = re.sub(r'\s*[-–—]\s*$', '', result)
+        result = _WS_RE.sub(' ', result)
+        result = _TRAIL_DASH_RE.sub('', result)
 
         return result.strip()
 
     def _clean_artist_name(self, artist: str) -> str:
         """Clean up artist name for better lyrics matching."""
         # Remove "- Topic" suffix from YouTube Music auto-generated channels
-        artist = re.sub(r'\s*-\s*Topic$', '', artist, flags=re.IGNORECASE)
+        artist = _TOPIC_RE.sub('', artist)
         # Remove "VEVO" suffix
-        artist = re.sub(r'VEVO$', '', artist, flags=re.IGNORECASE)
+        artist = _VEVO_RE.sub('', artist)
         return artist.strip()
@@ -1,6 +1,6 @@
 """Lyrics providers for fetching synced lyrics from various sources."""
 
-from ytmusicapi.providers.base import LyricsProvider, LyricLine, SyncedLyrics
+from ytmusicapi.providers.base import LyricsProvider, LyricLine, Query, SyncedLyrics, iter_lrc
 from ytmusicapi.providers.lrclib import LrcLibProvider
 from ytmusicapi.providers.netease import NetEaseProvider
 from ytmusicapi.providers.megalobiz import MegalobizProvider
@@ -9,9 +9,11 @@ from ytmusicapi.providers.searcher import SyncedLyricsSearcher
 __all__ = [
     "LyricsProvider",
     "LyricLine",
+    "Query",
     "SyncedLyrics",
     "LrcLibProvider",
     "NetEaseProvider",
     "MegalobizProvider",
     "SyncedLyricsSearcher",
+    "iter_lrc",
 ]
@@ -1,12 +1,110 @@
 """Base classes and data structures for lyrics providers."""
 
 from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
-from typing import Optional, List
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter, le
+from typing import Any, Callable, Optional, List, Tuple, Union
 import re
+import sys
+import unicodedata
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
-@dataclass
+# Decodes provider responses. orjson is several times faster, use it when installed.
+json_loads: Callable[[Union[bytes, str]], Any]
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    import json
+
+    json_loads = json.loads
+
+# Bracketed suffixes such as "(Remastered)". The negated class keeps unclosed
+# brackets linear instead of rescanning the rest of the string with ".*?".
+_BRACKETED_RE = re.compile(r'\s*[\(\[][^)\]\n]*[\)\]]')
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+
+# An LRC line: a leading "[mm:ss.xx]" timestamp, then the lyric text. Lines sharing
+# text may list more timestamps, e.g. "[00:12.00][01:30.00]Chorus". The first one is
+# captured directly, any others are collected in one group and split with _LRC_TIME_RE.
+_LRC_LINE_RE = re.compile(
+    r'^[ \t]*\[(\d{1,3}):(\d{1,2})(?:[.:](\d{1,3}))?\][ \t]*'
+    r'((?:\[\d{1,3}:\d{1,2}(?:[.:]\d{1,3})?\][ \t]*)*)([^\r\n]*)',
+    re.MULTILINE
+)
+_LRC_TIME_RE = re.compile(r'\[(\d{1,3}):(\d{1,2})(?:[.:](\d{1,3}))?\]')
+# Milliseconds per unit of an LRC fraction, by its number of digits
+_FRAC_SCALE = (0, 100, 10, 1)
+
+
+def normalize(text: str) -> str:
+    """
+    Canonical form of a track or artist name, for cache keys and comparisons.
+
+    Applies NFKC normalization and case folding and collapses whitespace, so
+    that e.g. "Ed  Sheeran" and "ed sheeran" compare equal.
+    """
+    return _WS_RE.sub(' ', unicodedata.normalize('NFKC', text).casefold()).strip()
+
+
+@dataclass(frozen=True, slots=True)
+class Query:
+    """
+    A track lookup, along with the normalized names used for cache keys and matching.
+
+    Build it with :meth:`of`, which memoizes recent queries, so the searcher and the
+    providers don't each normalize the same names again.
+    """
+    track: str
+    artist: str
+    track_key: str
+    artist_key: str
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def of(cls, track: str, artist: str) -> "Query":
+        """Get the query for a track and artist."""
+        return cls(track, artist, normalize(track), normalize(artist))
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """Normalized (track, artist) pair."""
+        return (self.track_key, self.artist_key)
+
+
+def create_session(pool_size: int = 32) -> requests.Session:
+    """
+    Create a session for provider requests.
+
+    Keeps up to ``pool_size`` keep-alive connections open per host and retries
+    requests failing with a transient server error.
+    Providers send their own headers with each request, so one session can be shared.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False
+        )
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+@dataclass(slots=True)
 class LyricLine:
     """Represents a single line of synced lyrics."""
     timestamp: str  # "[mm:ss.xx]" format
@@ -17,14 +115,106 @@ class LyricLine:
         return f"{self.timestamp} {self.text}"
 
 
-@dataclass
+def _lrc_entries(lines: Iterable[Sequence[str]]) -> Iterator[Tuple[int, str, str]]:
+    """
+    Expand the groups of _LRC_LINE_RE matches into (start ms, timestamp, text) entries,
+    one per timestamp, in document order.
+    """
+    for mins, secs, frac, more_stamps, text in lines:
+        text = text.strip()
+        stamps = [(mins, secs, frac)]
+        if more_stamps:
+            stamps += _LRC_TIME_RE.findall(more_stamps)
+        for mins, secs, frac in stamps:
+            m, s = int(mins), int(secs)
+            # Fractions are tenths, hundredths or thousandths of a second, normalize to ms
+            frac_ms = int(frac) * _FRAC_SCALE[len(frac)] if frac else 0
+            # The same timestamps recur in every song, share one string per value
+            timestamp = sys.intern("[%02d:%02d.%02d]" % (m, s, frac_ms // 10))
+            yield (m * 60 + s) * 1000 + frac_ms, timestamp, text
+
+
+def _parse_lrc(lrc: str) -> List[LyricLine]:
+    """Parse LRC format into LyricLine objects, sorted by timestamp."""
+    # findall hands back plain tuples, unmatched groups as ''
+    rows: List[Tuple[str, str, str, str, str]] = _LRC_LINE_RE.findall(lrc)
+    if not rows:
+        return []
+
+    ms: Sequence[int]
+    timestamps: Iterable[str]
+    texts: Iterable[str]
+    min_col, sec_col, frac_col, more_col, text_col = zip(*rows)
+    if any(more_col):
+        # Compressed LRC, expand the extra timestamps line by line
+        ms, timestamps, texts = zip(*_lrc_entries(rows))
+    else:
+        # One timestamp per line, convert column by column. The map() passes over
+        # builtins run in C, the comprehensions are still Python loops but skip
+        # unpacking and building a tuple per line.
+        minutes = list(map(int, min_col))
+        seconds = list(map(int, sec_col))
+        frac_ms = [int(frac) * _FRAC_SCALE[len(frac)] if frac else 0 for frac in frac_col]
+        ms = [(m * 60 + s) * 1000 + f for m, s, f in zip(minutes, seconds, frac_ms)]
+        centis = [f // 10 for f in frac_ms]
+        timestamps = map(sys.intern, map("[%02d:%02d.%02d]".__mod__, zip(minutes, seconds, centis)))
+        texts = map(str.strip, text_col)
+    lines = map(LyricLine, timestamps, texts, ms)
+
+    # Providers almost always send lines in order, only compressed LRC needs sorting
+    if all(map(le, ms, islice(ms, 1, None))):
+        return list(lines)
+    return sorted(lines, key=attrgetter("milliseconds"))
+
+
+def iter_lrc(lrc: str) -> Iterator[LyricLine]:
+    """
+    Lazily parse LRC format into lines, in the order they appear in the text.
+
+    Unlike :meth:`SyncedLyrics.from_lrc`, lines are not sorted by start time, which
+    only makes a difference for compressed LRC listing several timestamps per line.
+    Useful for previews that only need the first few lines.
+
+    Args:
+        lrc: LRC format lyrics
+    """
+    for ms, timestamp, text in _lrc_entries(m.groups('') for m in _LRC_LINE_RE.finditer(lrc)):
+        yield LyricLine(timestamp, text, ms)
+
+
+@dataclass(slots=True)
 class SyncedLyrics:
-    """Container for synced lyrics data."""
+    """
+    Container for synced lyrics data.
+
+    ``lines`` are expected in ascending timestamp order.
+    """
     track: str
     artist: str
     lrc: str  # Full LRC format string
     lines: List[LyricLine] = field(default_factory=list)
     source: str = ""
+    # Line start times, used to binary search in get_line_at
+    _ms: "array[int]" = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._ms = array('i', [line.milliseconds for line in self.lines])
+
+    @classmethod
+    def from_lrc(cls, lrc: str, track: str, artist: str, source: str = "") -> "SyncedLyrics":
+        """
+        Create SyncedLyrics from an LRC format string.
+
+        Lines without a timestamp, such as "[ti:...]" metadata tags, are skipped.
+        Lines with several timestamps produce one LyricLine per timestamp.
+
+        Args:
+            lrc: LRC format lyrics
+            track: Song title
+            artist: Artist name
+            source: Name of the provider the lyrics came from
+        """
+        return cls(track=track, artist=artist, lrc=lrc, lines=_parse_lrc(lrc), source=source)
 
     def to_lrc(self) -> str:
         """Return the raw LRC format string."""
@@ -36,13 +226,11 @@ class SyncedLyrics:
 
     def get_line_at(self, milliseconds: int) -> Optional[LyricLine]:
         """Get the lyric line at a specific timestamp."""
-        current_line = None
-        for line in self.lines:
-            if line.milliseconds <= milliseconds:
-                current_line = line
-            else:
-                break
-        return current_line
+        if len(self._ms) != len(self.lines):
+            # lines was modified after construction
+            self.__post_init__()
+        i = bisect_right(self._ms, milliseconds) - 1
+        return self.lines[i] if i >= 0 else None
 
 
 class LyricsProvider(ABC):
@@ -61,13 +249,20 @@ class LyricsProvider(ABC):
 
         Returns:
             LRC format lyrics string or None if not found
+
+        Raises:
+            LyricsProviderError: If the provider could not be reached or answered with
+                an error. Unlike None, this says nothing about whether lyrics exist.
         """
         pass
 
+    def close(self) -> None:
+        """Release resources held by the provider, such as a disk cache. Does nothing by default."""
+
     def _clean_query(self, text: str) -> str:
         """Clean up search query text."""
         # Remove common suffixes and special characters
-        text = re.sub(r'\s*[\(\[].*?[\)\]]', '', text)
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
+        text = _BRACKETED_RE.sub('', text)
+        text = _NON_WORD_RE.sub(' ', text)
+        text = _WS_RE.sub(' ', text)
         return text.strip()
@@ -0,0 +1,138 @@
+"""Caches used by the lyrics providers and searcher."""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+# Default for cache lookups, since None is a valid cached value
+MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory LRU cache with per-entry expiry.
+
+    The least recently used entry is evicted once ``maxsize`` is exceeded.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: Optional[float] = None):
+        """
+        Args:
+            maxsize: Maximum number of entries to keep
+            ttl: Default time-to-live in seconds. None means entries never expire.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value for ``key``, or ``default`` if absent or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires is not None and expires < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key``, overriding the default ttl if given."""
+        ttl = self.ttl if ttl is None else ttl
+        expires = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """
+    Persistent key/value store backed by SQLite, with per-entry expiry.
+
+    Values must be JSON serializable. Storage errors are swallowed and
+    treated as cache misses, so a broken cache never breaks a lookup.
+    """
+
+    FILENAME = "lyrics.sqlite3"
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: Directory to store the cache database in. Created if missing.
+        """
+        path = Path(directory).expanduser()
+        path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path / self.FILENAME), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            # Entries are only overwritten when looked up again, purge the rest here
+            self._conn.execute("DELETE FROM cache WHERE expires < ?", (time.time(),))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for ``key``, or ``default`` if absent or expired."""
+        return self.get_with_ttl(key, default)[0]
+
+    def get_with_ttl(self, key: str, default: Any = None) -> Tuple[Any, Optional[float]]:
+        """
+        Return the cached value for ``key`` and its remaining time-to-live in seconds,
+        or ``(default, None)`` if absent or expired. Expired entries are deleted.
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return default, None
+                ttl = row[1] - time.time()
+                if ttl < 0:
+                    with self._conn:
+                        self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    return default, None
+            return json.loads(row[0]), ttl
+        except (sqlite3.Error, ValueError):
+            return default, None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), time.time() + ttl),
+                )
+        except sqlite3.Error:
+            pass
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM cache")
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,8 +1,10 @@
 """LrcLib.net lyrics provider - free, no authentication required."""
 
 import requests
-from typing import Optional
-from ytmusicapi.providers.base import LyricsProvider
+from typing import Dict, Iterable, List, Optional, Tuple
+from ytmusicapi.exceptions import LyricsProviderError
+from ytmusicapi.providers.base import LyricsProvider, Query, create_session, json_loads, normalize
+from ytmusicapi.providers.cache import MISSING, TTLCache
 
 
 class LrcLibProvider(LyricsProvider):
@@ -16,12 +18,23 @@ class LrcLibProvider(LyricsProvider):
     name = "lrclib"
     BASE_URL = "https://lrclib.net/api"
     TIMEOUT = 10
+    HEADERS = {
+        "User-Agent": "ytmusicapi (https://github.com/sigma67/ytmusicapi)"
+    }
+    # Keep-alive connections kept open to lrclib, sized for concurrent lookups
+    POOL_SIZE = 32
+    # Responses are cached in-process, so repeated lookups don't hit the API again
+    CACHE_SIZE = 4096
+    CACHE_TTL = 3600
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "ytmusicapi (https://github.com/sigma67/ytmusicapi)"
-        })
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Args:
+            session: Session to send requests with, e.g. one shared between providers.
+                    If None, a new one is created.
+        """
+        self.session = session if session is not None else create_session(self.POOL_SIZE)
+        self._cache = TTLCache(maxsize=self.CACHE_SIZE, ttl=self.CACHE_TTL)
 
     def get_lyrics(self, track: str, artist: str) -> Optional[str]:
         """Fetch lyrics from LrcLib."""
@@ -35,6 +48,11 @@ class LrcLibProvider(LyricsProvider):
 
     def _get_exact_match(self, track: str, artist: str) -> Optional[str]:
         """Try to get an exact match for track and artist."""
+        key = ("get", *Query.of(track, artist).key)
+        cached = self._cache.get(key, MISSING)
+        if cached is not MISSING:
+            return cached
+
         try:
             response = self.session.get(
                 f"{self.BASE_URL}/get",
@@ -42,36 +60,52 @@ class LrcLibProvider(LyricsProvider):
                     "track_name": track,
                     "artist_name": artist
                 },
+                headers=self.HEADERS,
                 timeout=self.TIMEOUT
             )
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 # Prefer synced lyrics, fall back to plain
-                return data.get("syncedLyrics") or data.get("plainLyrics")
-        except (requests.RequestException, ValueError):
-            pass
-        return None
+                lyrics = data.get("syncedLyrics") or data.get("plainLyrics")
+                self._cache.set(key, lyrics)
+                return lyrics
+            if response.status_code == 404:
+                self._cache.set(key, None)
+                return None
+        except (requests.RequestException, ValueError) as e:
+            raise LyricsProviderError(f"lrclib lookup failed: {e}") from e
+        raise LyricsProviderError(f"lrclib lookup failed with HTTP {response.status_code}")
 
     def _search(self, track: str, artist: str) -> Optional[str]:
         """Search for lyrics if exact match fails."""
+        key = ("search", *Query.of(track, artist).key)
+        cached = self._cache.get(key, MISSING)
+        if cached is not MISSING:
+            return cached
+
         try:
             response = self.session.get(
                 f"{self.BASE_URL}/search",
                 params={"q": f"{artist} {track}"},
+                headers=self.HEADERS,
                 timeout=self.TIMEOUT
             )
             if response.status_code == 200:
-                results = response.json()
-                if results and len(results) > 0:
-                    # Return first result with synced lyrics
-                    for result in results:
-                        if result.get("syncedLyrics"):
-                            return result["syncedLyrics"]
-                    # Fall back to plain lyrics
-                    return results[0].get("plainLyrics")
-        except (requests.RequestException, ValueError):
-            pass
-        return None
+                lyrics = self._pick_search_result(json_loads(response.content))
+                self._cache.set(key, lyrics)
+                return lyrics
+        except (requests.RequestException, ValueError) as e:
+            raise LyricsProviderError(f"lrclib search failed: {e}") from e
+        raise LyricsProviderError(f"lrclib search failed with HTTP {response.status_code}")
+
+    def _pick_search_result(self, results: list) -> Optional[str]:
+        """Return the first result with synced lyrics, or plain lyrics of the first result."""
+        if not results:
+            return None
+        for result in results:
+            if result.get("syncedLyrics"):
+                return result["syncedLyrics"]
+        return results[0].get("plainLyrics")
 
     def get_by_duration(self, track: str, artist: str, duration: int) -> Optional[str]:
         """
@@ -90,11 +124,87 @@ class LrcLibProvider(LyricsProvider):
                     "artist_name": artist,
                     "duration": duration
                 },
+                headers=self.HEADERS,
                 timeout=self.TIMEOUT
             )
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 return data.get("syncedLyrics") or data.get("plainLyrics")
         except (requests.RequestException, ValueError):
             pass
         return None
+
+    def bulk_probe(self, queries: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+        """
+        Look up lyrics for several tracks with one search request per artist.
+
+        Tracks by the same artist are matched against the results of a single
+        artist search by normalized title. Only exact matches are accepted, since
+        similar titles are often different songs ("Interlude 1", "Interlude 2").
+        Artists with a single track are skipped, since a regular lookup costs the
+        same one request.
+
+        Args:
+            queries: Iterable of (track, artist) tuples
+
+        Returns:
+            Dict mapping (track, artist) to lyrics, for the tracks that were matched.
+            Tracks missing from the result need a regular :meth:`get_lyrics` lookup.
+        """
+        by_artist: Dict[str, List[Query]] = {}
+        for track, artist in queries:
+            query = Query.of(track, artist)
+            by_artist.setdefault(query.artist_key, []).append(query)
+
+        found = {}
+        for artist_key, group in by_artist.items():
+            if not artist_key or len({query.track_key for query in group}) < 2:
+                continue
+            candidates = self._artist_candidates(group[0])
+            for query in group:
+                lyrics = candidates.get(query.track_key)
+                if lyrics:
+                    found[(query.track, query.artist)] = lyrics
+        return found
+
+    def _artist_candidates(self, query: Query) -> Dict[str, str]:
+        """Search lrclib for the query's artist, returning lyrics by normalized track name."""
+        artist_key = query.artist_key
+        key = ("artist", artist_key)
+        cached = self._cache.get(key, MISSING)
+        if cached is not MISSING:
+            return cached
+
+        try:
+            response = self.session.get(
+                f"{self.BASE_URL}/search",
+                params={"q": query.artist},
+                headers=self.HEADERS,
+                timeout=self.TIMEOUT
+            )
+            if response.status_code != 200:
+                return {}
+
+            synced: Dict[str, str] = {}
+            plain: Dict[str, str] = {}
+            for result in json_loads(response.content):
+                # The query matches any field, keep only results by this artist
+                result_artist = normalize(result.get("artistName") or "")
+                if not result_artist or (
+                    result_artist not in artist_key and artist_key not in result_artist
+                ):
+                    continue
+                title = normalize(result.get("trackName") or "")
+                if result.get("syncedLyrics"):
+                    synced.setdefault(title, result["syncedLyrics"])
+                elif result.get("plainLyrics"):
+                    plain.setdefault(title, result["plainLyrics"])
+
+            # Prefer synced lyrics when a title appears more than once
+            candidates = {**plain, **synced}
+            self._cache.set(key, candidates)
+            return candidates
+        except (requests.RequestException, ValueError, AttributeError):
+            # AttributeError: unexpected response shape
+            pass
+        return {}
@@ -1,9 +1,30 @@
 """Megalobiz lyrics provider - web scraping fallback."""
 
+import html
 import re
 import requests
-from typing import Optional
-from ytmusicapi.providers.base import LyricsProvider
+from typing import Dict, Iterable, Optional
+from ytmusicapi.exceptions import LyricsProviderError
+from ytmusicapi.providers.base import LyricsProvider, Query, create_session
+from ytmusicapi.providers.cache import MISSING, TTLCache
+
+_BR_RE = re.compile(r'<br\s*/?>')
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Links to LRC pages in search results. Matched on the raw response bytes,
+# only the chosen link is decoded.
+_LRC_HREF_RE = re.compile(rb'href="(/lrc/[^"]+)"')
+
+# Elements that hold the LRC content on a lyrics page, in order of preference
+_LRC_CONTAINER_RE = re.compile(
+    r'<div[^>]*id="lrc_\d+_lyrics"[^>]*>(?P<lrc_div>[\s\S]*?)</div>'
+    r'|<pre[^>]*class="[^"]*lyrics[^"]*"[^>]*>(?P<pre>[\s\S]*?)</pre>'
+    r'|<div[^>]*class="[^"]*lrc-content[^"]*"[^>]*>(?P<lrc_content>[\s\S]*?)</div>',
+    re.IGNORECASE,
+)
+_LRC_CONTAINERS = ("lrc_div", "pre", "lrc_content")
+_NBSP_TO_SPACE = str.maketrans('\xa0', ' ')
+_TIMESTAMPED_RE = re.compile(r'(\[\d{2}:\d{2}[\.:]\d{2,3}\][^\[]+)')
 
 
 class MegalobizProvider(LyricsProvider):
@@ -17,13 +38,23 @@ class MegalobizProvider(LyricsProvider):
     BASE_URL = "https://www.megalobiz.com"
     SEARCH_URL = f"{BASE_URL}/search/all"
     TIMEOUT = 15
-
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        })
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    }
+    CHUNK_SIZE = 8192
+    # Search results and pages are cached in-process, so repeated lookups don't scrape again
+    CACHE_SIZE = 4096
+    CACHE_TTL = 3600
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Args:
+            session: Session to send requests with, e.g. one shared between providers.
+                    If None, a new one is created.
+        """
+        self.session = session if session is not None else create_session()
+        self._cache = TTLCache(maxsize=self.CACHE_SIZE, ttl=self.CACHE_TTL)
 
     def get_lyrics(self, track: str, artist: str) -> Optional[str]:
         """Fetch lyrics from Megalobiz."""
@@ -34,6 +65,11 @@ class MegalobizProvider(LyricsProvider):
 
     def _search(self, track: str, artist: str) -> Optional[str]:
         """Search for LRC file URL."""
+        key = ("search", *Query.of(track, artist).key)
+        cached = self._cache.get(key, MISSING)
+        if cached is not MISSING:
+            return cached
+
         try:
             query = self._clean_query(f"{artist} {track}")
             response = self.session.get(
@@ -42,70 +78,98 @@ class MegalobizProvider(LyricsProvider):
                     "qry": query,
                     "display": "more"
                 },
-                timeout=self.TIMEOUT
+                headers=self.HEADERS,
+                timeout=self.TIMEOUT,
+                stream=True
             )
-            if response.status_code != 200:
-                return None
-
-            # Find LRC links in search results
-            lrc_pattern = r'href="(/lrc/maker/[^"]+\.megalobiz)"'
-            matches = re.findall(lrc_pattern, response.text)
+            with response:
+                if response.status_code != 200:
+                    raise LyricsProviderError(f"Megalobiz search failed with HTTP {response.status_code}")
+                # Stop downloading the page as soon as a suitable link shows up
+                path = self._find_lrc_link(response.iter_content(chunk_size=self.CHUNK_SIZE))
 
-            if not matches:
-                # Try alternate pattern
-                lrc_pattern = r'href="(/lrc/[^"]+)"'
-                matches = re.findall(lrc_pattern, response.text)
+            url = f"{self.BASE_URL}{path}" if path else None
+            self._cache.set(key, url)
+            return url
 
-            if matches:
-                return f"{self.BASE_URL}{matches[0]}"
-
-        except requests.RequestException:
-            pass
-        return None
+        except requests.RequestException as e:
+            raise LyricsProviderError(f"Megalobiz search failed: {e}") from e
 
     def _get_lrc_content(self, url: str) -> Optional[str]:
         """Extract LRC content from the page."""
+        cached = self._cache.get(("page", url), MISSING)
+        if cached is not MISSING:
+            return cached
+
         try:
-            response = self.session.get(url, timeout=self.TIMEOUT)
+            response = self.session.get(url, headers=self.HEADERS, timeout=self.TIMEOUT)
             if response.status_code != 200:
-                return None
-
-            # Try multiple patterns to extract LRC content
-            patterns = [
-                r'<div[^>]*id="lrc_\d+_lyrics"[^>]*>([\s\S]*?)</div>',
-                r'<pre[^>]*class="[^"]*lyrics[^"]*"[^>]*>([\s\S]*?)</pre>',
-                r'<div[^>]*class="[^"]*lrc-content[^"]*"[^>]*>([\s\S]*?)</div>',
-            ]
-
-            for pattern in patterns:
-                match = re.search(pattern, response.text, re.IGNORECASE)
-                if match:
-                    lrc = match.group(1)
-                    return self._clean_lrc(lrc)
-
-            # Try to find any timestamped content
-            timestamp_pattern = r'(\[\d{2}:\d{2}[\.:]\d{2,3}\][^\[]+)'
-            timestamps = re.findall(timestamp_pattern, response.text)
-            if timestamps:
-                return "\n".join(timestamps)
-
-        except requests.RequestException:
-            pass
+                raise LyricsProviderError(f"Megalobiz page request failed with HTTP {response.status_code}")
+
+            lrc = self._extract_lrc(response.text)
+            self._cache.set(("page", url), lrc)
+            return lrc
+
+        except requests.RequestException as e:
+            raise LyricsProviderError(f"Megalobiz page request failed: {e}") from e
+
+    def _find_lrc_link(self, chunks: Iterable[bytes]) -> Optional[str]:
+        """
+        Return the path of the first LRC maker link, or else of the first LRC link.
+
+        Returns as soon as a maker link is found, without consuming the remaining chunks.
+        """
+        fallback = None
+        tail = b""
+        for chunk in chunks:
+            buffer = tail + chunk
+            end = 0
+            for match in _LRC_HREF_RE.finditer(buffer):
+                path = match.group(1)
+                if path.startswith(b"/lrc/maker/") and path.endswith(b".megalobiz"):
+                    return path.decode("utf-8", "replace")
+                if fallback is None:
+                    fallback = path
+                end = match.end()
+
+            # Carry an unterminated link into the next chunk, otherwise only enough
+            # bytes to complete an 'href="' split across the chunk boundary
+            start = buffer.rfind(b'href="', end)
+            if start == -1 or buffer.find(b'"', start + len(b'href="')) != -1:
+                start = max(end, len(buffer) - len(b'href="') + 1)
+            tail = buffer[start:]
+
+        return fallback.decode("utf-8", "replace") if fallback else None
+
+    def _extract_lrc(self, page: str) -> Optional[str]:
+        """Find the LRC content in a lyrics page."""
+        # Scan the page once for all known containers, keeping the first match of each
+        found: Dict[str, str] = {}
+        for match in _LRC_CONTAINER_RE.finditer(page):
+            # Every alternative ends in its named group, so lastgroup is always set
+            container = match.lastgroup
+            assert container is not None
+            found.setdefault(container, match.group(container))
+            if container == _LRC_CONTAINERS[0]:
+                break
+
+        for container in _LRC_CONTAINERS:
+            if container in found:
+                return self._clean_lrc(found[container])
+
+        # Try to find any timestamped content
+        timestamps = _TIMESTAMPED_RE.findall(page)
+        if timestamps:
+            return "\n".join(timestamps)
         return None
 
     def _clean_lrc(self, lrc: str) -> str:
         """Clean up extracted LRC content."""
         # Replace HTML line breaks
-        lrc = re.sub(r'<br\s*/?>', '\n', lrc)
+        lrc = _BR_RE.sub('\n', lrc)
         # Remove remaining HTML tags
-        lrc = re.sub(r'<[^>]+>', '', lrc)
-        # Decode HTML entities
-        lrc = lrc.replace('&nbsp;', ' ')
-        lrc = lrc.replace('&amp;', '&')
-        lrc = lrc.replace('&lt;', '<')
-        lrc = lrc.replace('&gt;', '>')
-        lrc = lrc.replace('&#39;', "'")
-        lrc = lrc.replace('&quot;', '"')
+        lrc = _TAG_RE.sub('', lrc)
+        # Decode HTML entities, with non-breaking spaces as plain spaces
+        lrc = html.unescape(lrc).translate(_NBSP_TO_SPACE)
         # Clean up whitespace
-        lines = [line.strip() for line in lrc.split('\n')]
-        return '\n'.join(line for line in lines if line)
+        return '\n'.join(filter(None, map(str.strip, lrc.split('\n'))))
@@ -1,8 +1,10 @@
 """NetEase Music lyrics provider - good for Asian music."""
 
 import requests
-from typing import Optional
-from ytmusicapi.providers.base import LyricsProvider
+from typing import Any, Dict, Optional, Tuple
+from ytmusicapi.exceptions import LyricsProviderError
+from ytmusicapi.providers.base import LyricsProvider, Query, create_session, json_loads, normalize
+from ytmusicapi.providers.cache import MISSING, DiskCache, TTLCache
 
 
 class NetEaseProvider(LyricsProvider):
@@ -17,14 +19,32 @@ class NetEaseProvider(LyricsProvider):
     SEARCH_URL = "https://music.163.com/api/search/get"
     LYRICS_URL = "https://music.163.com/api/song/lyric"
     TIMEOUT = 10
-
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Referer": "https://music.163.com",
-            "Accept": "application/json",
-        })
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Referer": "https://music.163.com",
+        "Accept": "application/json",
+    }
+    # Keep-alive connections kept open to NetEase, sized for concurrent lookups
+    POOL_SIZE = 32
+    # Responses are cached in-process, so get_translation doesn't repeat the search
+    CACHE_SIZE = 4096
+    CACHE_TTL = 3600
+    # Lifetimes in the optional disk cache. Lyrics of a song id practically never change,
+    # search results may as songs are added.
+    DISK_SEARCH_TTL = 7 * 24 * 3600
+    DISK_LYRICS_TTL = 30 * 24 * 3600
+
+    def __init__(self, cache_dir: Optional[str] = None, session: Optional[requests.Session] = None):
+        """
+        Args:
+            cache_dir: Directory for a persistent cache of search results and lyrics.
+                      If None, responses are only cached in memory.
+            session: Session to send requests with, e.g. one shared between providers.
+                    If None, a new one is created.
+        """
+        self.session = session if session is not None else create_session(self.POOL_SIZE)
+        self._cache = TTLCache(maxsize=self.CACHE_SIZE, ttl=self.CACHE_TTL)
+        self._disk_cache = DiskCache(cache_dir) if cache_dir is not None else None
 
     def get_lyrics(self, track: str, artist: str) -> Optional[str]:
         """Fetch lyrics from NetEase Music."""
@@ -35,6 +55,12 @@ class NetEaseProvider(LyricsProvider):
 
     def _search_song(self, track: str, artist: str) -> Optional[int]:
         """Search for a song and return its ID."""
+        query = Query.of(track, artist)
+        key = ("search", *query.key)
+        cached = self._cache_get(key)
+        if cached is not MISSING:
+            return cached
+
         try:
             response = self.session.post(
                 self.SEARCH_URL,
@@ -44,39 +70,63 @@ class NetEaseProvider(LyricsProvider):
                     "limit": 10,
                     "offset": 0
                 },
+                headers=self.HEADERS,
                 timeout=self.TIMEOUT
             )
             if response.status_code != 200:
-                return None
+                raise LyricsProviderError(f"NetEase search failed with HTTP {response.status_code}")
 
-            data = response.json()
-            songs = data.get("result", {}).get("songs", [])
+            data = json_loads(response.content)
+            try:
+                songs = data["result"]["songs"]
+            except (KeyError, TypeError):
+                songs = None
 
             if not songs:
+                # The song may still be added, so don't keep the miss around for long
+                self._cache_set(key, None, self.CACHE_TTL)
                 return None
 
-            # Try to find best match
-            track_lower = track.lower()
-            artist_lower = artist.lower()
-
+            # Try to find best match, on names normalized like the query's
+            track_key, artist_key = query.key
             for song in songs:
-                song_name = song.get("name", "").lower()
-                song_artists = [a.get("name", "").lower() for a in song.get("artists", [])]
+                song_name = normalize(song.get("name", ""))
 
-                # Check for good match
-                if track_lower in song_name or song_name in track_lower:
-                    if any(artist_lower in a or a in artist_lower for a in song_artists):
+                # Check for good match, artists only matter once the title matches
+                if track_key in song_name or song_name in track_key:
+                    song_artists = (normalize(a.get("name", "")) for a in song.get("artists", []))
+                    if any(artist_key in a or a in artist_key for a in song_artists):
+                        self._cache_set(key, song["id"], self.DISK_SEARCH_TTL)
                         return song["id"]
 
             # Return first result if no good match
+            self._cache_set(key, songs[0]["id"], self.DISK_SEARCH_TTL)
             return songs[0]["id"]
 
-        except (requests.RequestException, ValueError, KeyError):
-            pass
-        return None
+        except (requests.RequestException, ValueError, KeyError) as e:
+            raise LyricsProviderError(f"NetEase search failed: {e}") from e
 
     def _get_lyrics_by_id(self, song_id: int) -> Optional[str]:
         """Get lyrics by song ID."""
+        lyrics = self._get_lyrics_payload(song_id)
+        # Prefer synced lyrics (lrc format), try karaoke lyrics as fallback
+        return lyrics["lrc"] or lyrics["klyric"]
+
+    def _get_lyrics_payload(self, song_id: int) -> Dict[str, Optional[str]]:
+        """
+        Get all lyric versions of a song in one request.
+
+        Returns:
+            Dict with the "lrc", "klyric" and "tlyric" lyrics, each possibly None
+
+        Raises:
+            LyricsProviderError: If the request failed
+        """
+        key = ("payload", song_id)
+        cached = self._cache_get(key)
+        if cached is not MISSING:
+            return cached
+
         try:
             response = self.session.get(
                 self.LYRICS_URL,
@@ -84,42 +134,64 @@ class NetEaseProvider(LyricsProvider):
                     "id": song_id,
                     "lv": 1,  # lyric version
                     "kv": 1,  # karaoke version
-                    "tv": -1  # translation version
+                    "tv": 1  # translation version
                 },
+                headers=self.HEADERS,
                 timeout=self.TIMEOUT
             )
             if response.status_code != 200:
-                return None
+                raise LyricsProviderError(f"NetEase lyrics request failed with HTTP {response.status_code}")
+
+            data = json_loads(response.content)
+            lyrics = {}
+            for version in ("lrc", "klyric", "tlyric"):
+                # Versions a song doesn't have are missing or null
+                try:
+                    lyrics[version] = data[version]["lyric"]
+                except (KeyError, TypeError):
+                    lyrics[version] = None
+            self._cache_set(key, lyrics, self.DISK_LYRICS_TTL)
+            return lyrics
+
+        except (requests.RequestException, ValueError) as e:
+            raise LyricsProviderError(f"NetEase lyrics request failed: {e}") from e
 
-            data = response.json()
-
-            # Get synced lyrics (lrc format)
-            lrc = data.get("lrc", {}).get("lyric")
-            if lrc:
-                return lrc
-
-            # Try karaoke lyrics as fallback
-            return data.get("klyric", {}).get("lyric")
+    def get_translation(self, track: str, artist: str) -> Optional[str]:
+        """
+        Get translated lyrics if available (usually Chinese to English).
 
-        except (requests.RequestException, ValueError, KeyError):
-            pass
-        return None
+        Shares the request and cache with :meth:`get_lyrics`, so getting both is a single lookup.
 
-    def get_translation(self, track: str, artist: str) -> Optional[str]:
-        """Get translated lyrics if available (usually Chinese to English)."""
+        Raises:
+            LyricsProviderError: If NetEase could not be reached or answered with an error
+        """
         song_id = self._search_song(track, artist)
         if not song_id:
             return None
 
-        try:
-            response = self.session.get(
-                self.LYRICS_URL,
-                params={"id": song_id, "tv": 1},
-                timeout=self.TIMEOUT
-            )
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("tlyric", {}).get("lyric")
-        except (requests.RequestException, ValueError):
-            pass
-        return None
+        return self._get_lyrics_payload(song_id)["tlyric"]
+
+    def close(self) -> None:
+        """Close the disk cache, if enabled. The session is left open, since it may be shared."""
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+
+    def _cache_get(self, key: Tuple[Any, ...]) -> Any:
+        """Look up a cached response in memory, then on disk. Returns MISSING if there is none."""
+        cached = self._cache.get(key, MISSING)
+        if cached is not MISSING or self._disk_cache is None:
+            return cached
+        cached = self._disk_cache.get(self._disk_key(key), MISSING)
+        if cached is not MISSING:
+            self._cache.set(key, cached)
+        return cached
+
+    def _cache_set(self, key: Tuple[Any, ...], value: Any, disk_ttl: float) -> None:
+        """Cache a response in memory, and on disk for ``disk_ttl`` seconds if enabled."""
+        self._cache.set(key, value)
+        if self._disk_cache is not None:
+            self._disk_cache.set(self._disk_key(key), value, disk_ttl)
+
+    def _disk_key(self, key: Tuple[Any, ...]) -> str:
+        """Build a disk cache key, namespaced since the cache file may be shared."""
+        return "|".join([self.name, *map(str, key)])
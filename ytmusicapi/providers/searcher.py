@@ -1,18 +1,29 @@
 """Main lyrics searcher that aggregates multiple providers."""
 
+import hashlib
 import re
-from typing import Optional, List, Tuple
-from ytmusicapi.providers.base import LyricsProvider, LyricLine, SyncedLyrics
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, Optional, List, Set, Tuple
+from ytmusicapi.providers.base import (
+    LyricLine, LyricsProvider, Query, SyncedLyrics, create_session, iter_lrc
+)
+from ytmusicapi.providers.cache import MISSING, DiskCache, TTLCache
 from ytmusicapi.providers.lrclib import LrcLibProvider
 from ytmusicapi.providers.netease import NetEaseProvider
 from ytmusicapi.providers.megalobiz import MegalobizProvider
 
+# A line starting with an LRC timestamp. Anchored per line rather than to the start
+# of the text, since providers may prepend metadata tags or credit lines.
+_SYNCED_LINE_RE = re.compile(r'^[ \t]*\[\d{1,3}:\d{1,2}(?:[.:]\d{1,3})?\]', re.MULTILINE)
+
 
 class SyncedLyricsSearcher:
     """
     Search for synced lyrics across multiple providers.
 
-    Providers are tried in order until lyrics are found.
+    Providers are tried in order until lyrics are found, or queried
+    concurrently when searching with ``race=True``.
     Default order: lrclib -> netease -> megalobiz
     """
 
@@ -24,27 +35,74 @@ class SyncedLyricsSearcher:
 
     DEFAULT_ORDER = ["lrclib", "netease", "megalobiz"]
 
-    def __init__(self, providers: Optional[List[str]] = None):
+    # Upper bound on concurrent lookups in search_many, to stay polite to the providers
+    MAX_WORKERS = 8
+    # Keep-alive connections per provider host in the session shared by all providers
+    POOL_SIZE = 32
+    # search_many batches lrclib lookups per artist from this many tracks on
+    BULK_MIN_ITEMS = 3
+    # Seconds a race search waits for preferred providers once a lower priority one has a result
+    RACE_GRACE_PERIOD = 0.2
+
+    # Cache lifetimes in seconds. Lyrics rarely change, misses may be filled in later.
+    CACHE_HIT_TTL = 30 * 24 * 3600
+    CACHE_MISS_TTL = 3600
+    CACHE_SIZE = 512
+
+    def __init__(
+        self,
+        providers: Optional[List[str]] = None,
+        cache_dir: Optional[str] = None,
+        cache_size: int = CACHE_SIZE
+    ):
         """
         Initialize the searcher.
 
         Args:
             providers: List of provider names to use in order.
                       If None, uses all providers in default order.
+            cache_dir: Directory for a persistent lyrics cache.
+                      If None, results are only cached in memory.
+                      NetEase keeps its search results and lyrics there as well.
+            cache_size: Number of results kept in the in-memory cache.
+                       0 disables it.
         """
         if providers is None:
             providers = self.DEFAULT_ORDER
 
+        # One pooled session for all providers, they send their own headers per request
+        self._session = create_session(self.POOL_SIZE)
         self._providers: List[Tuple[str, LyricsProvider]] = []
         for name in providers:
-            if name in self.PROVIDERS:
-                self._providers.append((name, self.PROVIDERS[name]()))
+            if name not in self.PROVIDERS:
+                continue
+            if self.PROVIDERS[name] is NetEaseProvider:
+                # The only provider with a disk cache of its own, keys are namespaced by provider
+                provider: LyricsProvider = NetEaseProvider(cache_dir=cache_dir, session=self._session)
+            else:
+                provider = self.PROVIDERS[name](session=self._session)
+            self._providers.append((name, provider))
+
+        # Runs provider lookups for race searches and search_all. Threads are only started on demand.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(len(self._providers), 1) * self.MAX_WORKERS,
+            thread_name_prefix="lyrics"
+        )
+
+        self._memory_cache: Optional[TTLCache] = None
+        self._disk_cache: Optional[DiskCache] = None
+        if cache_size > 0:
+            self._memory_cache = TTLCache(maxsize=cache_size)
+        if cache_dir is not None:
+            self._disk_cache = DiskCache(cache_dir)
 
     def search(
         self,
         track: str,
         artist: str,
-        synced_only: bool = True
+        synced_only: bool = True,
+        no_cache: bool = False,
+        race: bool = False
     ) -> Optional[SyncedLyrics]:
         """
         Search for lyrics across all configured providers.
@@ -53,84 +111,338 @@ class SyncedLyricsSearcher:
             track: Song title
             artist: Artist name
             synced_only: If True, only return synced (timestamped) lyrics
+            no_cache: If True, skip the cache lookup and always query the providers.
+                     The fresh result is still written to the cache.
+            race: If True, query all providers at once and return the first
+                 usable result, instead of trying them one after another in order.
+                 Preferred providers that answer within :attr:`RACE_GRACE_PERIOD`
+                 of the first result still win. Faster when the preferred providers
+                 miss, but the result may come from a lower priority provider.
+                 Such results are not cached, so later ordered searches still
+                 get the preferred provider's lyrics.
+
+        Lookups where a provider failed, e.g. with a network error, are not cached
+        either, so they are retried on the next search.
 
         Returns:
             SyncedLyrics object or None if not found
         """
+        key = self._cache_key(track, artist, synced_only)
+        if not no_cache:
+            cached = self._cache_get(key)
+            if cached is not MISSING:
+                return self._to_synced_lyrics(track, artist, *cached) if cached else None
+
+        if race:
+            result, definitive = self._search_race(track, artist, synced_only)
+        else:
+            result, definitive = self._search_in_order(track, artist, synced_only)
+
+        if definitive:
+            self._cache_set(key, result)
+        return result
+
+    def search_iter(self, track: str, artist: str, synced_only: bool = True) -> Iterator[LyricLine]:
+        """
+        Search for lyrics like :meth:`search`, but parse the lines lazily.
+
+        Lines are yielded in the order they appear in the LRC, see :func:`iter_lrc`.
+        Results are read from the cache, but fresh results are not added to it.
+
+        Args:
+            track: Song title
+            artist: Artist name
+            synced_only: If True, only return synced (timestamped) lyrics
+
+        Returns:
+            Iterator over the lyric lines, empty if no lyrics were found
+        """
+        cached = self._cache_get(self._cache_key(track, artist, synced_only))
+        if cached is not MISSING:
+            return iter_lrc(cached[0]) if cached else iter(())
+
+        found, _ = self._find_in_order(track, artist, synced_only)
+        return iter_lrc(found[0]) if found is not None else iter(())
+
+    def _search_in_order(
+        self, track: str, artist: str, synced_only: bool
+    ) -> Tuple[Optional[SyncedLyrics], bool]:
+        """
+        Try the providers one by one, returning the first usable result.
+
+        Returns:
+            The result, and whether it is definitive, see :meth:`_find_in_order`
+        """
+        found, definitive = self._find_in_order(track, artist, synced_only)
+        if found is None:
+            return None, definitive
+        lrc, provider_name = found
+        return self._to_synced_lyrics(track, artist, lrc, provider_name), definitive
+
+    def _find_in_order(
+        self, track: str, artist: str, synced_only: bool
+    ) -> Tuple[Optional[Tuple[str, str]], bool]:
+        """
+        Try the providers one by one, returning the first usable LRC and its provider name.
+
+        Returns:
+            The LRC and provider name or None, and whether every provider tried
+            answered without an error. Only definitive results may be cached.
+        """
+        definitive = True
         for provider_name, provider in self._providers:
             try:
                 lrc = provider.get_lyrics(track, artist)
-                if lrc:
-                    is_synced = self._is_synced(lrc)
-                    if synced_only and not is_synced:
+            except Exception:
+                # The lookup may well succeed next time, so it doesn't count as a miss
+                definitive = False
+                continue
+            if lrc and (not synced_only or self._is_synced(lrc)):
+                return (lrc, provider_name), definitive
+        return None, definitive
+
+    def _search_race(
+        self, track: str, artist: str, synced_only: bool
+    ) -> Tuple[Optional[SyncedLyrics], bool]:
+        """
+        Query all providers concurrently, returning the first usable result.
+
+        Once a result is in, preferred providers still running get a short grace
+        period, so a tie goes to the provider earliest in the order.
+
+        Returns:
+            The result, and whether it is definitive, i.e. what an ordered search
+            would have found as well. That takes every preferred provider answering
+            without lyrics, rather than failing or being cut off by the grace period.
+        """
+        futures = {
+            self._executor.submit(provider.get_lyrics, track, artist): index
+            for index, (_, provider) in enumerate(self._providers)
+        }
+        found: Dict[int, str] = {}
+        # Providers that answered without usable lyrics
+        missed: Set[int] = set()
+        pending = set(futures)
+        deadline = None
+        try:
+            while pending:
+                timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+                for future in done:
+                    try:
+                        lrc = future.result()
+                    except Exception:
                         continue
+                    if lrc and (not synced_only or self._is_synced(lrc)):
+                        found[futures[future]] = lrc
+                    else:
+                        missed.add(futures[future])
+                if found:
+                    best = min(found)
+                    if all(futures[future] > best for future in pending):
+                        break
+                    if deadline is None:
+                        deadline = time.monotonic() + self.RACE_GRACE_PERIOD
+        finally:
+            # Lookups that already started still run to completion in the background
+            for future in pending:
+                future.cancel()
 
-                    lines = self._parse_lrc(lrc) if is_synced else []
-                    return SyncedLyrics(
-                        track=track,
-                        artist=artist,
-                        lrc=lrc,
-                        lines=lines,
-                        source=provider_name
-                    )
-            except Exception:
+        if not found:
+            return None, len(missed) == len(self._providers)
+        best = min(found)
+        result = self._to_synced_lyrics(track, artist, found[best], self._providers[best][0])
+        return result, missed.issuperset(range(best))
+
+    def search_many(
+        self,
+        items: Iterable[Tuple[str, str]],
+        synced_only: bool = True,
+        max_workers: Optional[int] = None
+    ) -> List[Optional[SyncedLyrics]]:
+        """
+        Search lyrics for several tracks concurrently.
+
+        Lookups are network-bound, so they are dispatched on a thread pool
+        with at most ``max_workers`` requests in flight at any time.
+        If lrclib is the preferred provider, tracks by the same artist are first
+        looked up with a single search request, see :meth:`LrcLibProvider.bulk_probe`.
+
+        Args:
+            items: Iterable of (track, artist) tuples
+            synced_only: If True, only return synced (timestamped) lyrics
+            max_workers: Maximum number of concurrent lookups.
+                        Defaults to :attr:`MAX_WORKERS`.
+
+        Returns:
+            List of SyncedLyrics or None, in the same order as ``items``
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        workers = min(max_workers or self.MAX_WORKERS, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            probed = {}
+            if len(items) >= self.BULK_MIN_ITEMS:
+                probed = self._bulk_probe(executor, items, synced_only)
+            futures = [
+                None if (track, artist) in probed
+                else executor.submit(self.search, track, artist, synced_only)
+                for track, artist in items
+            ]
+
+        results: List[Optional[SyncedLyrics]] = []
+        for item, future in zip(items, futures):
+            if future is None:
+                results.append(probed[item])
                 continue
+            try:
+                results.append(future.result())
+            except Exception:
+                results.append(None)
+        return results
+
+    def _bulk_probe(
+        self,
+        executor: ThreadPoolExecutor,
+        items: List[Tuple[str, str]],
+        synced_only: bool
+    ) -> Dict[Tuple[str, str], SyncedLyrics]:
+        """
+        Resolve uncached items through lrclib artist searches, one per artist.
 
-        return None
+        Only used when lrclib is the preferred provider, so results respect the provider order.
+        """
+        if not self._providers:
+            return {}
+        provider_name, provider = self._providers[0]
+        if not isinstance(provider, LrcLibProvider):
+            return {}
+
+        by_artist: Dict[str, List[Tuple[str, str]]] = {}
+        for track, artist in items:
+            if self._cache_get(self._cache_key(track, artist, synced_only)) is MISSING:
+                by_artist.setdefault(Query.of(track, artist).artist_key, []).append((track, artist))
+
+        probed = {}
+        for future in [executor.submit(provider.bulk_probe, group) for group in by_artist.values()]:
+            try:
+                found = future.result()
+            except Exception:
+                continue
+            for (track, artist), lrc in found.items():
+                if synced_only and not self._is_synced(lrc):
+                    continue
+                lyrics = self._to_synced_lyrics(track, artist, lrc, provider_name)
+                self._cache_set(self._cache_key(track, artist, synced_only), lyrics)
+                probed[(track, artist)] = lyrics
+        return probed
 
     def search_all(self, track: str, artist: str) -> List[SyncedLyrics]:
         """
         Search all providers and return all results.
 
         Useful for comparing lyrics from different sources.
+        Providers are queried concurrently, results are returned in provider order.
         """
+        futures = [
+            (provider_name, self._executor.submit(provider.get_lyrics, track, artist))
+            for provider_name, provider in self._providers
+        ]
         results = []
-        for provider_name, provider in self._providers:
+        for provider_name, future in futures:
             try:
-                lrc = provider.get_lyrics(track, artist)
+                lrc = future.result()
                 if lrc:
-                    lines = self._parse_lrc(lrc) if self._is_synced(lrc) else []
-                    results.append(SyncedLyrics(
-                        track=track,
-                        artist=artist,
-                        lrc=lrc,
-                        lines=lines,
-                        source=provider_name
-                    ))
+                    results.append(self._to_synced_lyrics(track, artist, lrc, provider_name))
             except Exception:
                 continue
         return results
 
-    def _is_synced(self, lrc: str) -> bool:
-        """Check if lyrics contain timestamps."""
-        return bool(re.search(r'\[\d{2}:\d{2}', lrc))
-
-    def _parse_lrc(self, lrc: str) -> List[LyricLine]:
-        """Parse LRC format into structured LyricLine objects."""
-        lines = []
-        # Pattern matches [mm:ss.xx] or [mm:ss:xx] format
-        pattern = r'\[(\d{2}):(\d{2})[\.:]+(\d{2,3})\](.*)'
-
-        for line in lrc.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
+    def clear_cache(self) -> None:
+        """Remove all cached search results, on disk including NetEase's cached responses."""
+        if self._memory_cache is not None:
+            self._memory_cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
+
+    def close(self) -> None:
+        """
+        Release the searcher's worker threads, disk caches and connections.
+
+        Queued lookups are cancelled, lookups that already started finish in the background.
+        The searcher must not be used afterwards.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for _, provider in self._providers:
+            provider.close()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+        self._session.close()
+
+    def _to_synced_lyrics(self, track: str, artist: str, lrc: str, source: str) -> SyncedLyrics:
+        """Build a SyncedLyrics object, parsing the lines if the lyrics are synced."""
+        return SyncedLyrics.from_lrc(lrc, track, artist, source)
+
+    def _cache_key(self, track: str, artist: str, synced_only: bool) -> str:
+        """Build a cache key, results depend on the configured providers and their order."""
+        providers = ",".join(name for name, _ in self._providers)
+        query = Query.of(track, artist)
+        raw = f"{providers}|{query.track_key}|{query.artist_key}|{synced_only}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Any:
+        """
+        Look up a cached result.
+
+        Returns:
+            The (lrc, source) of a cached hit, None for a cached miss,
+            or MISSING if there is no entry
+        """
+        if self._memory_cache is not None:
+            cached = self._memory_cache.get(key, MISSING)
+            if cached is not MISSING:
+                return cached
+
+        if self._disk_cache is None:
+            return MISSING
+        data, ttl = self._disk_cache.get_with_ttl(key, MISSING)
+        if data is MISSING:
+            return MISSING
+
+        result = (data["lrc"], data["source"]) if data else None
+        if self._memory_cache is not None:
+            # Expire from memory together with the disk entry
+            self._memory_cache.set(key, result, ttl)
+        return result
 
-            match = re.match(pattern, line)
-            if match:
-                mins, secs, ms, text = match.groups()
-                # Normalize milliseconds to 3 digits
-                ms = ms.ljust(3, '0')[:3]
-                total_ms = int(mins) * 60000 + int(secs) * 1000 + int(ms)
-                timestamp = f"[{mins}:{secs}.{ms[:2]}]"
-                lines.append(LyricLine(
-                    timestamp=timestamp,
-                    text=text.strip(),
-                    milliseconds=total_ms
-                ))
-
-        # Sort by timestamp
-        return sorted(lines, key=lambda x: x.milliseconds)
+    def _cache_set(self, key: str, result: Optional[SyncedLyrics]) -> None:
+        """
+        Cache a search result. Misses are cached too, for a shorter time.
+
+        Only the LRC and source are kept. Hits are parsed into a new SyncedLyrics
+        for every caller, so callers can't see each other's edits or track names.
+        """
+        ttl = self.CACHE_HIT_TTL if result is not None else self.CACHE_MISS_TTL
+        if self._memory_cache is not None:
+            self._memory_cache.set(key, (result.lrc, result.source) if result is not None else None, ttl)
+        if self._disk_cache is not None:
+            data = None
+            if result is not None:
+                data = {"track": result.track, "artist": result.artist, "lrc": result.lrc, "source": result.source}
+            self._disk_cache.set(key, data, ttl)
+
+    def _is_synced(self, lrc: str) -> bool:
+        """Check if lyrics contain a line starting with a timestamp."""
+        # Plain lyrics usually have no brackets at all, so skip the regex scan for them.
+        # Otherwise start matching at the line holding the first bracket.
+        bracket = lrc.find('[')
+        if bracket == -1:
+            return False
+        return _SYNCED_LINE_RE.search(lrc, lrc.rfind('\n', 0, bracket) + 1) is not None
 
     @classmethod
     def available_providers(cls) -> List[str]: